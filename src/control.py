@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+import json
+import os
+import socket
+import socketserver
+import stat
+from threading import Thread
+
+COMMANDS = ('status', 'flush', 'pause', 'resume', 'dump-pending')
+CLIENT_TIMEOUT = 120
+REQUEST_TIMEOUT = 5
+
+
+class _ControlHandler(socketserver.StreamRequestHandler):
+    timeout = REQUEST_TIMEOUT
+
+    def handle(self):
+        try:
+            command = self.rfile.readline().decode('utf-8').strip()
+        except Exception:
+            return
+        if not command:
+            return
+
+        scrobbler = self.server.scrobbler
+        try:
+            if command == 'status':
+                self._send(scrobbler.control_status())
+            elif command == 'flush':
+                self._send(scrobbler.control_flush())
+            elif command == 'pause':
+                self._send(scrobbler.control_pause())
+            elif command == 'resume':
+                self._send(scrobbler.control_resume())
+            elif command == 'dump-pending':
+                reply = scrobbler.control_pending()
+                if not reply['ok']:
+                    self._send(reply)
+                    return
+                for listen_dict in reply['listens']:
+                    self._send(listen_dict)
+                # closing status line; lets the client tell an empty dump from a lost one
+                self._send({'ok': True, 'count': len(reply['listens'])})
+            else:
+                self._send({'ok': False, 'error': f"unknown command: {command}"})
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        except Exception as e:
+            scrobbler.log.error(f"Control err: {e}")
+            try:
+                self._send({'ok': False, 'error': str(e)})
+            except OSError:
+                pass
+
+    def _send(self, payload):
+        self.wfile.write((json.dumps(payload) + '\n').encode('utf-8'))
+
+
+class _ControlServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _socket_in_use(socket_path):
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    probe.settimeout(REQUEST_TIMEOUT)
+    try:
+        probe.connect(socket_path)
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+class ControlServer:
+    """Unix socket server; one daemon thread per connection, so commands
+    never run on the watcher or submission threads."""
+
+    def __init__(self, socket_path, scrobbler):
+        self.socket_path = socket_path
+        self.scrobbler = scrobbler
+        self._server = None
+
+    def start(self):
+        socket_dir = os.path.dirname(self.socket_path)
+        if socket_dir:
+            os.makedirs(socket_dir, exist_ok=True)
+        if os.path.lexists(self.socket_path):
+            if not stat.S_ISSOCK(os.lstat(self.socket_path).st_mode):
+                raise RuntimeError(f"not a socket: {self.socket_path}")
+            if _socket_in_use(self.socket_path):
+                raise RuntimeError(f"socket in use: {self.socket_path}")
+            os.remove(self.socket_path)
+
+        # bind to a temp name, chmod, then rename: socket_path never exists
+        # wider than 0600, and the process umask is left alone
+        temp_path = f"{self.socket_path}.{os.getpid()}"
+        if os.path.lexists(temp_path) and stat.S_ISSOCK(os.lstat(temp_path).st_mode):
+            os.remove(temp_path)
+        self._server = _ControlServer(temp_path, _ControlHandler, bind_and_activate=False)
+        bound_path = None
+        try:
+            self._server.socket.bind(temp_path)
+            bound_path = temp_path
+            os.chmod(temp_path, 0o600)
+            os.rename(temp_path, self.socket_path)
+            bound_path = self.socket_path
+            self._server.server_address = self.socket_path
+            self._server.server_activate()
+        except Exception:
+            self._server.server_close()
+            self._server = None
+            if bound_path:
+                os.remove(bound_path)
+            raise
+        self._server.scrobbler = self.scrobbler
+        Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        if not self._server:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        try:
+            os.remove(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+def run_client(socket_path, command):
+    """Send one command and print each JSON line of the reply. Returns exit code."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # flush drains the whole cache at the API's rate limit; no fixed bound fits
+    sock.settimeout(None if command == 'flush' else CLIENT_TIMEOUT)
+    try:
+        sock.connect(socket_path)
+    except OSError as e:
+        print(f"Control conn err: {socket_path}: {e}")
+        sock.close()
+        return 1
+
+    status = 0
+    replied = False
+    try:
+        with sock, sock.makefile('rwb') as stream:
+            stream.write(f"{command}\n".encode('utf-8'))
+            stream.flush()
+            for line in stream:
+                line = line.decode('utf-8').rstrip('\n')
+                if not line:
+                    continue
+                reply = json.loads(line)
+                if 'ok' not in reply:
+                    # dump-pending: one cached listen per line
+                    print(line, flush=True)
+                    continue
+                replied = True
+                if not reply['ok']:
+                    status = 1
+                # dump-pending's closing status line is not part of its output
+                if command != 'dump-pending' or not reply['ok']:
+                    print(line, flush=True)
+    except (OSError, ValueError) as e:
+        print(f"Control err: {e}")
+        return 1
+    if not replied:
+        print("Control err: no reply")
+        return 1
+    return status
@@ -26,6 +26,7 @@ from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
 from __version__ import __version__
+from control import COMMANDS, ControlServer, run_client
 from logger import Logger
 
 MAX_CACHE_SIZE = 1000
@@ -36,6 +37,7 @@ SAVE_DELAY = 5
 DEFAULT_MIN_PLAY_TIME = 30
 CANONICAL_MAX_DELAY = 240
 CANONICAL_HALF = 0.5
+DEFAULT_CONTROL_SOCKET = 'lbms.sock'
 SUBMISSION_CLIENT = 'lbms'
 MEDIA_PLAYER = 'MPD'
 
@@ -51,6 +53,26 @@ def print_banner():
     print(f"\nLISTENBRAINZ-MOODE-SCROBBLER v{__version__}\n")
 
 
+def load_settings():
+    settings_path = os.path.join(os.path.dirname(__file__), 'settings.json')
+    try:
+        with open(settings_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Settings not found: {settings_path}")
+    except json.JSONDecodeError as e:
+        raise json.JSONDecodeError(f"Settings invalid JSON: {e.msg}", e.doc, e.pos)
+
+
+def cache_dir():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+
+
+def control_socket_path(settings):
+    """Relative paths resolve into the cache dir, like cache_file."""
+    return os.path.join(cache_dir(), settings.get('control_socket', DEFAULT_CONTROL_SOCKET))
+
+
 class ListenCache:
     def __init__(self, cache_file, logger):
         self.cache_file = cache_file
@@ -140,6 +162,14 @@ class ListenCache:
         with self._lock:
             return len(self.pending_listens) > 0
 
+    def pending_count(self):
+        with self._lock:
+            return len(self.pending_listens)
+
+    def snapshot(self):
+        with self._lock:
+            return list(self.pending_listens)
+
     def process_pending_listens(self, client):
         """Uses single submission for small queues, batch for larger ones."""
         with self._lock:
@@ -208,7 +238,7 @@ class ListenBrainzScrobbler(FileSystemEventHandler):
         else:
             load_dotenv()
 
-        self.settings = self._load_settings()
+        self.settings = load_settings()
         self.log = Logger(self.settings)
         self.client = None
 
@@ -222,6 +252,8 @@ class ListenBrainzScrobbler(FileSystemEventHandler):
 
         self.current_song = None
         self.play_start_time = None
+        self.scrobble_due = None
+        self.last_error = None
         self.retry_count = self.settings['retry']['count']
         self.retry_delay = self.settings['retry']['delay']
 
@@ -232,7 +264,10 @@ class ListenBrainzScrobbler(FileSystemEventHandler):
 
         self._currentsong_realpath = os.path.realpath(self.settings['currentsong_file'])
         self.listen_cache = None
+        self.control_server = None
         self._shutdown_event = Event()
+        self._paused_event = Event()
+        self._cache_process_lock = Lock()
         self._preprocess_filters()
 
     def _preprocess_filters(self):
@@ -257,13 +292,22 @@ class ListenBrainzScrobbler(FileSystemEventHandler):
             return False
 
         if self.settings['features']['enable_cache']:
-            cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
             self.listen_cache = ListenCache(
-                os.path.join(cache_dir, self.settings['cache_file']),
+                os.path.join(cache_dir(), self.settings['cache_file']),
                 self.log
             )
             Thread(target=self._check_connection_periodically, daemon=True).start()
 
+        if self.settings['features'].get('enable_control', True):
+            socket_path = control_socket_path(self.settings)
+            try:
+                self.control_server = ControlServer(socket_path, self)
+                self.control_server.start()
+                self.log.ok(f"Control: {socket_path}")
+            except Exception as e:
+                self.control_server = None
+                self.log.error(f"Control err: {e}")
+
         return True
 
     def _check_connection_periodically(self):
@@ -273,17 +317,97 @@ class ListenBrainzScrobbler(FileSystemEventHandler):
     def check_connection_and_process_cache(self):
         if not self.listen_cache or not self.listen_cache.has_pending():
             return
+        if not self._cache_process_lock.acquire(blocking=False):
+            return
 
         try:
+            if self._paused_event.is_set():
+                return
             self.log.info("Cache processing")
 
             if self.listen_cache.process_pending_listens(self.client):
                 self.log.ok("Cache done")
             else:
                 self.log.warning("Cache partial")
+                self._set_last_error("Cache partial")
 
         except Exception as e:
             self.log.debug(f"Conn check failed: {e}")
+            self._set_last_error(f"Conn check failed: {e}")
+        finally:
+            self._cache_process_lock.release()
+
+    def _set_last_error(self, message):
+        self.last_error = {'message': message, 'time': int(time.time())}
+
+    def control_status(self):
+        song = self.current_song
+        due = self.scrobble_due
+        return {
+            'ok': True,
+            'version': __version__,
+            'dry_run': self.dry_run,
+            'paused': self._paused_event.is_set(),
+            'current_track': {
+                'title': song.get('title'),
+                'artist': song.get('artist'),
+                'album': song.get('album'),
+            } if song else None,
+            'scrobble_in': max(0, round(due - time.time())) if due is not None else None,
+            'pending': self.listen_cache.pending_count() if self.listen_cache else None,
+            'last_error': self.last_error,
+        }
+
+    def control_flush(self):
+        """Drain the cache back-to-back, without waiting for the periodic check."""
+        if not self.listen_cache:
+            return {'ok': False, 'error': 'cache disabled'}
+        if self._paused_event.is_set():
+            return {'ok': False, 'error': 'paused'}
+
+        with self._cache_process_lock:
+            before = self.listen_cache.pending_count()
+            self.log.info(f"Cache flush: {before} pending")
+            stopped = None
+            while self.listen_cache.has_pending():
+                if self._shutdown_event.is_set():
+                    stopped = 'shutdown'
+                    break
+                if self._paused_event.is_set():
+                    stopped = 'paused'
+                    break
+                if not self.listen_cache.process_pending_listens(self.client):
+                    stopped = 'submission failed'
+                    self._set_last_error("Cache flush partial")
+                    break
+            remaining = self.listen_cache.pending_count()
+
+        if not stopped:
+            self.log.ok("Cache flush done")
+            return {'ok': True, 'flushed': max(0, before - remaining), 'pending': remaining}
+
+        self.log.warning(f"Cache flush partial: {stopped}")
+        return {'ok': False, 'error': stopped,
+                'flushed': max(0, before - remaining), 'pending': remaining}
+
+    def control_pause(self):
+        if not self.listen_cache:
+            return {'ok': False, 'error': 'cache disabled'}
+        if not self._paused_event.is_set():
+            self._paused_event.set()
+            self.log.info("Submissions paused")
+        return {'ok': True, 'paused': True}
+
+    def control_resume(self):
+        if self._paused_event.is_set():
+            self._paused_event.clear()
+            self.log.info("Submissions resumed")
+        return {'ok': True, 'paused': False}
+
+    def control_pending(self):
+        if not self.listen_cache:
+            return {'ok': False, 'error': 'cache disabled'}
+        return {'ok': True, 'listens': self.listen_cache.snapshot()}
 
     def check_initial_playback(self):
         self.log.info("Initial check")
@@ -391,6 +515,7 @@ class ListenBrainzScrobbler(FileSystemEventHandler):
             return True
         except Exception as e:
             self.log.error(f"Now playing err: {e}")
+            self._set_last_error(f"Now playing err: {e}")
             return False
 
     def submit_listen(self, song_info, play_start_time):
@@ -405,6 +530,11 @@ class ListenBrainzScrobbler(FileSystemEventHandler):
             self.log.debug(f"[DRY] payload: {listen_dict}")
             return
 
+        if self._paused_event.is_set() and self.listen_cache:
+            self.listen_cache.add_listen(listen_dict)
+            self.log.info(f"Paused, cached: {song_info['title']} - {song_info['artist']}")
+            return
+
         for attempt in range(self.retry_count):
             if self._shutdown_event.is_set():
                 self.log.warning("Shutdown: retries aborted")
@@ -416,6 +546,7 @@ class ListenBrainzScrobbler(FileSystemEventHandler):
             except Exception as e:
                 self.log.error(f"Submit failed: {song_info['title']} - {song_info['artist']}")
                 self.log.error(f"Attempt {attempt + 1}/{self.retry_count}: {e}")
+                self._set_last_error(f"Submit failed: {e}")
                 if attempt < self.retry_count - 1:
                     self.log.wait(f"Retry in {self.retry_delay}s")
                     if self._shutdown_event.wait(self.retry_delay):
@@ -448,6 +579,7 @@ class ListenBrainzScrobbler(FileSystemEventHandler):
                 self.log.info(f"Stopped: {self.current_song.get('title')}")
                 self.current_song = None
                 self.play_start_time = None
+                self.scrobble_due = None
             return
 
         if not self._same_track(song_info, self.current_song):
@@ -462,6 +594,7 @@ class ListenBrainzScrobbler(FileSystemEventHandler):
             if self.settings['features']['enable_listen']:
                 play_start = self.play_start_time
                 delay = self._canonical_delay(song_info)
+                self.scrobble_due = play_start + delay
                 Thread(target=self._delayed_submit, args=(song_info, play_start, delay), daemon=True).start()
 
     def _delayed_submit(self, song_info, play_start_time, delay):
@@ -469,6 +602,7 @@ class ListenBrainzScrobbler(FileSystemEventHandler):
             return
         if self.play_start_time != play_start_time or not self._same_track(song_info, self.current_song):
             return
+        self.scrobble_due = None
         self.submit_listen(song_info, play_start_time)
 
     def _handle_file_change(self, event_type):
@@ -490,16 +624,6 @@ class ListenBrainzScrobbler(FileSystemEventHandler):
         if dest and os.path.realpath(dest) == self._currentsong_realpath:
             self._handle_file_change("moved")
 
-    def _load_settings(self):
-        settings_path = os.path.join(os.path.dirname(__file__), 'settings.json')
-        try:
-            with open(settings_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Settings not found: {settings_path}")
-        except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(f"Settings invalid JSON: {e.msg}", e.doc, e.pos)
-
     def _should_ignore(self, song_info):
         def match_patterns(text, patterns):
             if not text or not patterns:
@@ -518,6 +642,8 @@ class ListenBrainzScrobbler(FileSystemEventHandler):
 
     def cleanup(self):
         self._shutdown_event.set()
+        if self.control_server:
+            self.control_server.stop()
         if self.listen_cache:
             self.listen_cache.save_cache()
 
@@ -527,11 +653,26 @@ def _parse_args():
     parser.add_argument('--dry-run', action='store_true',
                         help='Run pipeline without submitting to ListenBrainz')
     parser.add_argument('--version', action='version', version=f'lbms {__version__}')
+    subparsers = parser.add_subparsers(dest='command')
+    ctl = subparsers.add_parser('ctl', help='Send a command to the running scrobbler')
+    ctl.add_argument('action', choices=COMMANDS)
     return parser.parse_args()
 
 
+def _run_ctl(action):
+    try:
+        settings = load_settings()
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        print(f"Config err: {e}")
+        return 1
+    return run_client(control_socket_path(settings), action)
+
+
 def main():
     args = _parse_args()
+    if args.command == 'ctl':
+        return _run_ctl(args.action)
+
     scrobbler = None
     observer = None
 